@@ -5,6 +5,8 @@ from flask_bcrypt import Bcrypt
 from flask_login import LoginManager, login_user, logout_user, login_required, UserMixin, current_user
 from datetime import datetime
 import sqlalchemy.exc  # For handling SQLAlchemy exceptions
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 import random
 from openai import OpenAI  # Import OpenAI client
 import json
@@ -27,6 +29,16 @@ bcrypt = Bcrypt(app)
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 
+# Comment thread paging: top-level comments and replies are served a page at a
+# time, nested replies are cut off after a bounded depth and each response
+# carries at most MAX_COMMENT_NODES nested replies.
+COMMENTS_PER_PAGE = 20
+MAX_COMMENTS_PER_PAGE = 100
+REPLIES_PER_COMMENT = 5
+DEFAULT_COMMENT_DEPTH = 3
+MAX_COMMENT_DEPTH = 10
+MAX_COMMENT_NODES = 200
+
 # variable temperature for more AI creativity 
 def get_variable_temperature(base_temp=0.7, variation=0.3):
     return max(0.1, min(2.0, base_temp + random.uniform(-variation, variation) + random.choice([-0.01, 0.01])))
@@ -87,9 +99,12 @@ class Post(db.Model):
 # Comment model
 class Comment(db.Model):
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_post_parent_id', 'post_id', 'parent_comment_id', 'id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), nullable=False)
-    parent_comment_id = db.Column(db.Integer, db.ForeignKey('comments.id'), nullable=True)
+    parent_comment_id = db.Column(db.Integer, db.ForeignKey('comments.id'), nullable=True, index=True)
     content = db.Column(db.Text, nullable=False)
     upvotes = db.Column(db.Integer, default=0)
     downvotes = db.Column(db.Integer, default=0)
@@ -334,9 +349,7 @@ def generate_content(num_posts, content_prompt, image_ratio):
 @app.route('/')
 def index():
     posts = Post.query.order_by(Post.timestamp.desc()).all()
-    comments = Comment.query.all()
-    comment_tree = [build_comment_tree(comment, {c.id: c for c in comments}) for comment in comments if comment.parent_comment_id is None]
-    return render_template('index.html', posts=posts, comment_tree=comment_tree)
+    return render_template('index.html', posts=posts)
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
@@ -458,29 +471,103 @@ def api_get_posts():
 
 @app.route('/api/posts/<int:post_id>/comments', methods=['GET'])
 def api_get_comments(post_id):
-    comments = Comment.query.filter_by(post_id=post_id).all()
-    comments_by_id = {comment.id: comment for comment in comments}
-    comment_tree = [build_comment_tree(comment, comments_by_id) for comment in comments if comment.parent_comment_id is None]
-    return jsonify(comment_tree)
-
-def build_comment_tree(comment, comments_by_id, level=0):
-    children = [
-        build_comment_tree(child_comment, comments_by_id, level + 1)
-        for child_comment in comments_by_id.values() if child_comment.parent_comment_id == comment.id
-    ]
+    # Comments are paged per parent: without parent_id this returns a page of
+    # top-level comments, with parent_id it returns a page of replies to that
+    # comment ("load more replies"). Pages are keyed on the last comment id
+    # seen, passed back as the opaque "after" continuation token.
+    parent_id = request.args.get('parent_id', None, type=int)
+    after = request.args.get('after', 0, type=int)
+    limit = min(max(1, request.args.get('limit', COMMENTS_PER_PAGE, type=int)), MAX_COMMENTS_PER_PAGE)
+    depth = min(max(0, request.args.get('depth', DEFAULT_COMMENT_DEPTH, type=int)), MAX_COMMENT_DEPTH)
+
+    roots = Comment.query.options(joinedload(Comment.author)) \
+        .filter_by(post_id=post_id, parent_comment_id=parent_id) \
+        .filter(Comment.id > after) \
+        .order_by(Comment.id) \
+        .limit(limit + 1).all()
+    continuation = str(roots[limit - 1].id) if len(roots) > limit else None
+
+    return jsonify({
+        "comments": build_comment_tree(roots[:limit], max_depth=depth),
+        "continuation": continuation
+    })
+
+def serialize_comment(comment, level=0):
     return {
         "id": comment.id,
         "post_id": comment.post_id,
+        "parent_comment_id": comment.parent_comment_id,
         "content": comment.content,
         "upvotes": comment.upvotes,
         "downvotes": comment.downvotes,
         "is_ai_generated": comment.is_ai_generated,
         "timestamp": comment.timestamp.isoformat(),
         "author": comment.author.username if comment.author else "Anonymous",
-        "children": children,
+        "children": [],
+        "reply_count": 0,
+        "continuation": None,
         "level": level
     }
 
+def build_comment_tree(roots, max_depth=DEFAULT_COMMENT_DEPTH, replies_per_comment=REPLIES_PER_COMMENT,
+                       max_nodes=MAX_COMMENT_NODES):
+    """Build nested comment dicts for roots, one query per level instead of recursing.
+
+    Each comment gets at most replies_per_comment replies, nesting stops at
+    max_depth and no more than max_nodes replies are added in total. A comment
+    whose replies were cut off gets a continuation token to pass as "after"
+    together with its id as parent_id.
+    """
+    tree = [serialize_comment(comment) for comment in roots]
+    frontier = {node["id"]: node for node in tree}
+    budget = max_nodes
+    level = 0
+
+    while frontier:
+        reply_counts = dict(
+            db.session.query(Comment.parent_comment_id, func.count(Comment.id))
+            .filter(Comment.parent_comment_id.in_(list(frontier)))
+            .group_by(Comment.parent_comment_id)
+            .all()
+        )
+        if not reply_counts:
+            break
+
+        children = []
+        if level < max_depth and budget > 0:
+            # Rank replies within each parent so the per-comment cap is applied
+            # in SQL, and take rank 1 of every parent before rank 2 so the node
+            # budget is spread across the level.
+            ranked = db.session.query(
+                Comment.id,
+                func.row_number().over(
+                    partition_by=Comment.parent_comment_id, order_by=Comment.id
+                ).label('rank')
+            ).filter(Comment.parent_comment_id.in_(list(reply_counts))).subquery()
+            children = Comment.query.options(joinedload(Comment.author)) \
+                .join(ranked, Comment.id == ranked.c.id) \
+                .filter(ranked.c.rank <= replies_per_comment) \
+                .order_by(ranked.c.rank, Comment.id) \
+                .limit(budget).all()
+            budget -= len(children)
+
+        next_frontier = {}
+        for child in sorted(children, key=lambda c: c.id):
+            node = serialize_comment(child, level + 1)
+            frontier[child.parent_comment_id]["children"].append(node)
+            next_frontier[child.id] = node
+
+        for comment_id, count in reply_counts.items():
+            parent = frontier[comment_id]
+            parent["reply_count"] = count
+            if len(parent["children"]) < count:
+                parent["continuation"] = str(parent["children"][-1]["id"]) if parent["children"] else "0"
+
+        frontier = next_frontier
+        level += 1
+
+    return tree
+
 @app.route('/api/posts', methods=['POST'])
 @login_required
 def api_submit_post():
@@ -23,6 +23,7 @@ document.addEventListener('DOMContentLoaded', () => {
     let currentPage = 1;
     let currentSort = 'top';
     const postsPerPage = 10;
+    const commentsPerPage = 20;
 
     function isMainPage() {
         return currentGroup === 'frontpage';
@@ -206,22 +207,68 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
-    function loadComments(postId) {
-        fetch(`/api/posts/${postId}/comments`)
+    function loadComments(postId, after = null) {
+        let url = `/api/posts/${postId}/comments?limit=${commentsPerPage}`;
+        if (after !== null) {
+            url += `&after=${after}`;
+        }
+        fetch(url)
             .then(response => response.json())
-            .then(comments => {
+            .then(page => {
                 const commentsContainer = document.getElementById(`comments-${postId}`);
-                commentsContainer.innerHTML = '';
-                if (comments.length === 0) {
+                if (after === null) {
+                    commentsContainer.innerHTML = '';
+                }
+                const previousMoreButton = commentsContainer.querySelector(':scope > .load-more-comments-btn');
+                if (previousMoreButton) {
+                    previousMoreButton.remove();
+                }
+                if (page.comments.length === 0 && after === null) {
                     commentsContainer.innerHTML = '<p>No comments yet.</p>';
                     return;
                 }
-                comments.forEach(comment => {
+                page.comments.forEach(comment => {
                     const commentElement = renderComment(comment);
                     commentsContainer.appendChild(commentElement);
                 });
+                if (page.continuation !== null) {
+                    const moreButton = document.createElement('button');
+                    moreButton.className = 'load-more-comments-btn';
+                    moreButton.textContent = 'Load more comments';
+                    moreButton.addEventListener('click', () => {
+                        moreButton.disabled = true;
+                        loadComments(postId, page.continuation);
+                    });
+                    commentsContainer.appendChild(moreButton);
+                }
+            })
+            .catch(error => {
+                console.error('Error loading comments:', error);
+                const moreButton = document.querySelector(`#comments-${postId} > .load-more-comments-btn`);
+                if (moreButton) {
+                    moreButton.disabled = false;
+                }
+            });
+    }
+
+    function loadReplies(comment, commentElement, depth, moreButton) {
+        fetch(`/api/posts/${comment.post_id}/comments?parent_id=${comment.id}&after=${moreButton.dataset.continuation}&limit=${commentsPerPage}`)
+            .then(response => response.json())
+            .then(page => {
+                page.comments.forEach(reply => {
+                    commentElement.insertBefore(renderComment(reply, depth + 1), moreButton);
+                });
+                if (page.continuation !== null) {
+                    moreButton.dataset.continuation = page.continuation;
+                    moreButton.disabled = false;
+                } else {
+                    moreButton.remove();
+                }
             })
-            .catch(error => console.error('Error loading comments:', error));
+            .catch(error => {
+                console.error('Error loading replies:', error);
+                moreButton.disabled = false;
+            });
     }
 
     function renderComment(comment, depth = 0) {
@@ -256,6 +303,19 @@ document.addEventListener('DOMContentLoaded', () => {
             });
         }
 
+        if (comment.continuation !== null) {
+            const moreButton = document.createElement('button');
+            moreButton.className = 'load-more-replies-btn';
+            moreButton.dataset.continuation = comment.continuation;
+            moreButton.textContent = `Load more replies (${comment.reply_count - comment.children.length})`;
+            moreButton.addEventListener('click', () => {
+                moreButton.disabled = true;
+                moreButton.textContent = 'Load more replies';
+                loadReplies(comment, commentElement, depth, moreButton);
+            });
+            commentElement.appendChild(moreButton);
+        }
+
         return commentElement;
     }
 